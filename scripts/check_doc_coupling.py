@@ -4,6 +4,7 @@
 Usage:
     python scripts/check_doc_coupling.py [--base BASE_REF] [--suggest]
     python scripts/check_doc_coupling.py --staged  # For pre-commit hook
+    git diff --cached --name-only -z | python scripts/check_doc_coupling.py --files-from -
     python scripts/check_doc_coupling.py --bidirectional  # Check both directions
     python scripts/check_doc_coupling.py --suggest-all FILE  # Show all relationships
 
@@ -13,6 +14,9 @@ changed files, then checks if coupled docs were also updated.
 The --staged option checks only staged files, suitable for pre-commit hooks.
 If source files are staged AND their coupled docs are also staged, it passes.
 
+The --files-from option checks a list of paths (NUL- or newline-separated,
+'-' for stdin) instead of asking git, for hooks that already have the list.
+
 Bidirectional mode (Plan #216):
 - Code changes → surface related docs + ADRs
 - Doc changes → surface related code + ADRs
@@ -25,13 +29,18 @@ Exit codes:
 
 import argparse
 import fnmatch
+import json
+import os
 import re
-import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import yaml
+# yaml, subprocess and the process pool are imported where first needed:
+# a warm parse cache skips yaml, --files-from/--validate-config skip git.
+if TYPE_CHECKING:
+    import subprocess
 
 # Plan #218: Weight-aware check control
 try:
@@ -43,6 +52,101 @@ except ImportError:
 
 META_CONFIG_FILE = Path("meta-process.yaml")
 RELATIONSHIPS_FILE = Path("scripts/relationships.yaml")
+# Parsed-YAML cache, alongside the other runtime state in .claude/
+PARSE_CACHE_FILE = Path(".claude/doc_coupling_cache.json")
+
+# Changesets at least this large are matched across worker processes
+PARALLEL_MIN_FILES = 5000
+_PARALLEL_CHUNK_FILES = 250
+
+# ADR file names look like 0003-contracts-can-do-anything.md
+_ADR_RE = re.compile(r"(\d{4})-[^/]+\.md$")
+
+
+# JSON object keys are strings; mappings with other keys (ADR ids are
+# integers) are stored as {_PAIRS_KEY: [[key, value], ...]}
+_PAIRS_KEY = "__pairs__"
+
+
+def _to_json(obj: Any) -> Any:
+    """Encode parsed YAML for json.dumps, keeping non-string mapping keys."""
+    if isinstance(obj, dict):
+        if _PAIRS_KEY not in obj and all(isinstance(key, str) for key in obj):
+            return {key: _to_json(value) for key, value in obj.items()}
+        return {_PAIRS_KEY: [[_to_json(key), _to_json(value)] for key, value in obj.items()]}
+    if isinstance(obj, list):
+        return [_to_json(item) for item in obj]
+    return obj
+
+
+def _from_json(obj: Any) -> Any:
+    """Invert _to_json."""
+    if isinstance(obj, dict):
+        if len(obj) == 1 and _PAIRS_KEY in obj:
+            return {_from_json(key): _from_json(value) for key, value in obj[_PAIRS_KEY]}
+        return {key: _from_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_from_json(item) for item in obj]
+    return obj
+
+
+@lru_cache(maxsize=1)
+def _load_parse_cache() -> dict[str, Any]:
+    """Load {path: [mtime_ns, size, _to_json(data)]} from PARSE_CACHE_FILE ({} if unusable).
+
+    JSON, never pickle: the file sits in the working tree, where a pull
+    request could plant one.
+    """
+    try:
+        cache = json.loads(PARSE_CACHE_FILE.read_bytes())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file once per run, and across runs while it is unchanged.
+
+    relationships.yaml is read by both load_couplings and load_relationships;
+    callers treat the result as read-only. Parses are kept in
+    PARSE_CACHE_FILE keyed on (mtime_ns, size); one that JSON cannot
+    carry exactly (e.g. YAML dates) is simply re-parsed each run.
+    """
+    st = path.stat()
+    cache = _load_parse_cache()
+    cached = cache.get(str(path))
+    if isinstance(cached, list) and len(cached) == 3 and cached[:2] == [st.st_mtime_ns, st.st_size]:
+        try:
+            return _from_json(cached[2])
+        except (TypeError, ValueError, AttributeError):
+            pass  # Malformed entry: re-parse
+
+    import yaml
+
+    # Prefer the LibYAML C loader; fall back to pure Python when unavailable
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_bytes(), Loader=loader)
+    try:
+        encoded = json.loads(json.dumps(_to_json(data)))
+        if _from_json(encoded) != data:
+            return data
+    except (TypeError, ValueError):
+        return data
+    cache[str(path)] = [st.st_mtime_ns, st.st_size, encoded]
+    # Written to a temp file and renamed, so a concurrent run (hook and CI)
+    # never reads a half-written cache
+    tmp = PARSE_CACHE_FILE.with_name(f".{PARSE_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        PARSE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, PARSE_CACHE_FILE)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+    return data
 
 
 def load_meta_config() -> dict:
@@ -62,8 +166,7 @@ def load_meta_config() -> dict:
         return defaults
 
     try:
-        with open(META_CONFIG_FILE) as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(META_CONFIG_FILE) or {}
         # Merge with defaults
         enforcement = defaults["enforcement"].copy()
         enforcement.update(config.get("enforcement", {}))
@@ -72,42 +175,73 @@ def load_meta_config() -> dict:
         return defaults
 
 
-def get_changed_files(base_ref: str) -> set[str]:
-    """Get files changed between base_ref and HEAD."""
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", base_ref, "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return set(result.stdout.strip().split("\n")) - {""}
-    except subprocess.CalledProcessError:
-        # Fallback: compare against HEAD~1 for local testing
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "HEAD~1", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return set(result.stdout.strip().split("\n")) - {""}
-        except subprocess.CalledProcessError:
-            return set()
-
-
-def get_staged_files() -> set[str]:
-    """Get files staged for commit."""
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return set(result.stdout.strip().split("\n")) - {""}
-    except subprocess.CalledProcessError:
-        return set()
+def _git_diff_names(*args: str) -> "subprocess.Popen[str]":
+    """Start `git diff --name-only -z` with extra args (NUL-separated output).
+
+    Returns the running process; collect it with communicate(). Starting
+    it early lets git walk the tree while the caller parses config.
+    """
+    import subprocess
+
+    return subprocess.Popen(
+        ["git", "diff", "--name-only", "-z", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _split_names(output: str) -> frozenset[str]:
+    """Parse NUL-separated `git diff --name-only -z` output."""
+    return frozenset(output.split("\0")) - {""}
+
+
+def get_changed_files(
+    base_ref: str,
+    pending: "subprocess.Popen[str] | None" = None,
+) -> frozenset[str]:
+    """Get files changed on HEAD since it diverged from base_ref.
+
+    Args:
+        base_ref: Ref to compare against.
+        pending: Already-started _git_diff_names(f"{base_ref}...HEAD").
+    """
+    proc = pending or _git_diff_names(f"{base_ref}...HEAD")
+    stdout, _ = proc.communicate()
+    if proc.returncode == 0:
+        return _split_names(stdout)
+
+    # Fallback: compare against HEAD~1 for local testing (decided on the
+    # exit code alone; git's messages are translated)
+    proc = _git_diff_names("HEAD~1", "HEAD")
+    stdout, _ = proc.communicate()
+    if proc.returncode == 0:
+        return _split_names(stdout)
+    return frozenset()
+
+
+def get_staged_files(pending: "subprocess.Popen[str] | None" = None) -> frozenset[str]:
+    """Get files staged for commit.
+
+    Args:
+        pending: Already-started _git_diff_names("--cached").
+    """
+    proc = pending or _git_diff_names("--cached")
+    stdout, _ = proc.communicate()
+    if proc.returncode == 0:
+        return _split_names(stdout)
+    return frozenset()
+
+
+def read_file_list(source: str) -> frozenset[str]:
+    """Read changed paths from a file, or stdin if source is '-'.
+
+    Paths are NUL-separated if the input contains a NUL (as from
+    `git diff --name-only -z`), newline-separated otherwise.
+    """
+    data = sys.stdin.read() if source == "-" else Path(source).read_text()
+    separator = "\0" if "\0" in data else "\n"
+    return frozenset(data.split(separator)) - {""}
 
 
 def load_couplings(config_path: Path) -> list[dict]:
@@ -123,15 +257,13 @@ def load_couplings(config_path: Path) -> list[dict]:
     # Check if we should use relationships.yaml instead
     relationships_path = config_path.parent / "relationships.yaml"
     if config_path.name == "doc_coupling.yaml" and relationships_path.exists():
-        with open(relationships_path) as f:
-            unified_data = yaml.safe_load(f)
+        unified_data = _load_yaml(relationships_path)
         if unified_data and "couplings" in unified_data:
             # Use unified relationships.yaml
             return unified_data.get("couplings", [])
 
     # Fall back to specified config file
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(config_path)
     return data.get("couplings", [])
 
 
@@ -148,8 +280,7 @@ def load_relationships(config_path: Path | None = None) -> dict[str, Any]:
     if not path.exists():
         return {"adrs": {}, "governance": [], "couplings": []}
 
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(path) or {}
 
     return {
         "adrs": data.get("adrs", {}),
@@ -158,7 +289,7 @@ def load_relationships(config_path: Path | None = None) -> dict[str, Any]:
     }
 
 
-def extract_adr_number(filepath: Path) -> int | None:
+def extract_adr_number(filepath: Path | str) -> int | None:
     """Extract ADR number from an ADR file path.
 
     Args:
@@ -167,19 +298,79 @@ def extract_adr_number(filepath: Path) -> int | None:
     Returns:
         ADR number (e.g., 3) or None if not an ADR path.
     """
-    if "docs/adr/" not in str(filepath):
+    path_str = filepath if isinstance(filepath, str) else str(filepath)
+    if "docs/adr/" not in path_str:
         return None
 
     # Match pattern like 0001-xxx.md or 0003-xxx.md
-    match = re.search(r"(\d{4})-[^/]+\.md$", str(filepath))
+    match = _ADR_RE.search(path_str)
     if match:
         return int(match.group(1))
     return None
 
 
+class Coupling(NamedTuple):
+    """A coupling definition unpacked once for the matching loops."""
+
+    sources: tuple[str, ...]
+    docs: tuple[str, ...]
+    description: str
+    soft: bool
+    pattern: re.Pattern[str]  # All source globs as one alternation
+
+    def matches(self, filepath: str, name: str) -> bool:
+        """True if filepath, or its basename name, matches a source glob."""
+        return bool(self.pattern.match(filepath) or self.pattern.match(name))
+
+
+def _build_coupling_index(couplings: list[dict]) -> list[Coupling]:
+    """Unpack coupling dicts into Coupling records.
+
+    Each coupling's source globs are joined into one alternation, so a
+    changed file is tested against a coupling with a single match call
+    (plus one on its basename, as in matches_any_pattern). Couplings with
+    no sources can never match and are dropped.
+    """
+    index: list[Coupling] = []
+    for coupling in couplings:
+        sources = tuple(coupling.get("sources", []))
+        if not sources:
+            continue
+        index.append(Coupling(
+            sources=sources,
+            docs=tuple(coupling.get("docs", [])),
+            description=coupling.get("description", ""),
+            soft=bool(coupling.get("soft", False)),
+            pattern=re.compile("|".join(fnmatch.translate(p) for p in sources)),
+        ))
+    return index
+
+
+_GovernanceIndex = tuple[dict[str, list[dict[str, Any]]], dict[int, list[str]]]
+
+
+def _index_governance(relationships: dict[str, Any]) -> _GovernanceIndex:
+    """Index governance entries by source path and by ADR number.
+
+    Returns:
+        (entries_by_source, sources_by_adr) - both keep file order, so
+        lookups yield the same results as scanning the list.
+    """
+    by_source: dict[str, list[dict[str, Any]]] = {}
+    by_adr: dict[int, list[str]] = {}
+    for entry in relationships.get("governance", []):
+        source = entry.get("source", "")
+        by_source.setdefault(source, []).append(entry)
+        for adr_num in entry.get("adrs", []):
+            by_adr.setdefault(adr_num, []).append(source)
+    return by_source, by_adr
+
+
 def get_related_nodes(
     changed_file: Path,
     relationships: dict[str, Any],
+    governance_index: _GovernanceIndex | None = None,
+    coupling_index: list[Coupling] | None = None,
 ) -> list[str]:
     """Find all nodes related to changed_file in any direction.
 
@@ -190,53 +381,50 @@ def get_related_nodes(
     Args:
         changed_file: Path to the changed file.
         relationships: Dict from load_relationships().
+        governance_index: Prebuilt _index_governance(relationships), for
+            callers that look up many files.
+        coupling_index: Prebuilt _build_coupling_index() of the
+            relationships' couplings, likewise.
 
     Returns:
         List of related file paths.
     """
     related: list[str] = []
     filepath = str(changed_file)
+    name = changed_file.name
 
     # Check couplings (source ↔ doc, bidirectional)
-    for coupling in relationships.get("couplings", []):
-        sources = coupling.get("sources", [])
-        docs = coupling.get("docs", [])
-
+    if coupling_index is None:
+        coupling_index = _build_coupling_index(relationships.get("couplings", []))
+    for coupling in coupling_index:
         # If changed file matches a source pattern, add related docs
-        if matches_any_pattern(filepath, sources):
-            related.extend(docs)
+        if coupling.matches(filepath, name):
+            related.extend(coupling.docs)
 
         # If changed file is a doc, add related sources
-        if filepath in docs:
-            related.extend(sources)
+        if filepath in coupling.docs:
+            related.extend(coupling.sources)
 
     # Check governance (source ↔ ADR, bidirectional)
-    for entry in relationships.get("governance", []):
-        source = entry.get("source", "")
-        adrs = entry.get("adrs", [])
-
-        # If changed file is a governed source, add related ADRs
-        if filepath == source:
-            adr_defs = relationships.get("adrs", {})
-            for adr_num in adrs:
-                adr_info = adr_defs.get(adr_num, {})
-                adr_file = adr_info.get("file", f"{adr_num:04d}-unknown.md")
-                related.append(f"docs/adr/{adr_file}")
-
-        # If changed file is an ADR, add governed sources
-        adr_num = extract_adr_number(changed_file)
-        if adr_num is not None and adr_num in adrs:
-            related.append(source)
+    if governance_index is None:
+        governance_index = _index_governance(relationships)
+    by_source, by_adr = governance_index
+
+    # If changed file is a governed source, add related ADRs
+    adr_defs = relationships.get("adrs", {})
+    for entry in by_source.get(filepath, []):
+        for adr_num in entry.get("adrs", []):
+            adr_info = adr_defs.get(adr_num, {})
+            adr_file = adr_info.get("file", f"{adr_num:04d}-unknown.md")
+            related.append(f"docs/adr/{adr_file}")
+
+    # If changed file is an ADR, add governed sources
+    adr_num = extract_adr_number(filepath)
+    if adr_num is not None:
+        related.extend(by_adr.get(adr_num, []))
 
     # Remove duplicates while preserving order
-    seen: set[str] = set()
-    unique_related: list[str] = []
-    for item in related:
-        if item not in seen:
-            seen.add(item)
-            unique_related.append(item)
-
-    return unique_related
+    return list(dict.fromkeys(related))
 
 
 def get_related_nodes_with_context(
@@ -254,21 +442,20 @@ def get_related_nodes_with_context(
     Returns:
         Dict with 'related' (list of paths) and 'context' (string or None).
     """
-    related = get_related_nodes(changed_file, relationships)
+    governance_index = _index_governance(relationships)
+    related = get_related_nodes(changed_file, relationships, governance_index)
     context = None
 
     # Find governance context for this file
-    filepath = str(changed_file)
-    for entry in relationships.get("governance", []):
-        if entry.get("source") == filepath:
-            context = entry.get("context", "")
-            break
+    entries = governance_index[0].get(str(changed_file))
+    if entries:
+        context = entries[0].get("context", "")
 
     return {"related": related, "context": context}
 
 
 def check_bidirectional(
-    changed_files: set[str],
+    changed_files: frozenset[str],
     relationships: dict[str, Any],
 ) -> list[dict[str, Any]]:
     """Check couplings bidirectionally.
@@ -284,9 +471,33 @@ def check_bidirectional(
         List of warning dicts with 'changed', 'related', 'description'.
     """
     warnings: list[dict[str, Any]] = []
+    governance_index = _index_governance(relationships)
+    by_source, by_adr = governance_index
+    coupling_index = _build_coupling_index(relationships.get("couplings", []))
+
+    # Most changed files relate to nothing; rule them out with one regex
+    # match and a set lookup before the full per-coupling walk
+    all_patterns = [p for c in coupling_index for p in c.sources]
+    any_source = (
+        re.compile("|".join(fnmatch.translate(p) for p in all_patterns))
+        if all_patterns else None
+    )
+    known_paths = frozenset(
+        [doc for c in coupling_index for doc in c.docs] + list(by_source)
+    )
 
     for changed in changed_files:
-        related = get_related_nodes(Path(changed), relationships)
+        name = changed.rpartition("/")[2]
+        if not (
+            changed in known_paths
+            or (any_source and (any_source.match(changed) or any_source.match(name)))
+            or extract_adr_number(changed) in by_adr
+        ):
+            continue
+
+        related = get_related_nodes(
+            Path(changed), relationships, governance_index, coupling_index
+        )
 
         # Find which related files were NOT changed
         missing = [r for r in related if r not in changed_files]
@@ -323,9 +534,9 @@ def get_suggest_all_output(
     # Find ADRs that govern this file
     adrs_found: list[str] = []
     context = None
+    adr_defs = relationships.get("adrs", {})
     for entry in relationships.get("governance", []):
         if entry.get("source") == filepath_str:
-            adr_defs = relationships.get("adrs", {})
             for adr_num in entry.get("adrs", []):
                 adr_info = adr_defs.get(adr_num, {})
                 adr_file = adr_info.get("file", f"{adr_num:04d}-unknown.md")
@@ -335,13 +546,10 @@ def get_suggest_all_output(
 
     # Find coupled docs
     docs_found: list[str] = []
-    for coupling in relationships.get("couplings", []):
-        sources = coupling.get("sources", [])
-        docs = coupling.get("docs", [])
-        if matches_any_pattern(filepath_str, sources):
-            for doc in docs:
-                desc = coupling.get("description", "")
-                docs_found.append(f"{doc} ({desc})")
+    for coupling in _build_coupling_index(relationships.get("couplings", [])):
+        if coupling.matches(filepath_str, filepath.name):
+            for doc in coupling.docs:
+                docs_found.append(f"{doc} ({coupling.description})")
 
     # Format output
     if adrs_found:
@@ -370,28 +578,98 @@ def validate_config(couplings: list[dict]) -> list[str]:
 
     Returns list of warnings for missing files.
     """
-    warnings = []
-    for coupling in couplings:
-        for doc in coupling.get("docs", []):
-            if not Path(doc).exists():
-                warnings.append(f"Coupled doc doesn't exist: {doc}")
-        # Don't validate source patterns - they're globs
-    return warnings
+    # Many couplings share docs; stat each distinct path once.
+    # Don't validate source patterns - they're globs
+    docs = dict.fromkeys(doc for c in couplings for doc in c.get("docs", []))
+    return [
+        f"Coupled doc doesn't exist: {doc}"
+        for doc in docs
+        if not os.path.exists(doc)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _compiled(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern once; couplings reuse the same few patterns."""
+    return re.compile(fnmatch.translate(pattern))
 
 
 def matches_any_pattern(filepath: str, patterns: list[str]) -> bool:
     """Check if filepath matches any glob pattern."""
+    name = filepath.rpartition("/")[2]
     for pattern in patterns:
-        if fnmatch.fnmatch(filepath, pattern):
+        regex = _compiled(pattern)
+        if regex.match(filepath):
             return True
         # Also check without leading path for simple patterns
-        if fnmatch.fnmatch(Path(filepath).name, pattern):
+        if regex.match(name):
             return True
     return False
 
 
+def _with_names(files: frozenset[str]) -> list[tuple[str, str]]:
+    """Pair each file with its basename so per-coupling loops reuse it."""
+    return [(f, f.rpartition("/")[2]) for f in files]
+
+
+def _matching_files(
+    regex: re.Pattern[str],
+    named_files: list[tuple[str, str]],
+) -> list[str]:
+    """Return files whose path or basename matches regex."""
+    return [f for f, name in named_files if regex.match(f) or regex.match(name)]
+
+
+# Per-worker state for _match_chunk, set by _init_matcher
+_worker_regexes: list[re.Pattern[str]] = []
+
+
+def _init_matcher(regexes: list[re.Pattern[str]]) -> None:
+    """ProcessPoolExecutor initializer: ship the coupling regexes once per worker."""
+    global _worker_regexes
+    _worker_regexes = regexes
+
+
+def _match_chunk(named_files: list[tuple[str, str]]) -> list[list[str]]:
+    """Match one chunk of files against every coupling (worker side)."""
+    return [_matching_files(regex, named_files) for regex in _worker_regexes]
+
+
+def _match_couplings(
+    index: list[Coupling],
+    named_files: list[tuple[str, str]],
+) -> list[list[str]]:
+    """Return, per coupling in index, the files matching its sources.
+
+    Large changesets are split into chunks matched in worker processes
+    (regex matching holds the GIL, so threads would not help); results
+    keep the order of named_files.
+    """
+    regexes = [coupling.pattern for coupling in index]
+    workers = min(8, os.cpu_count() or 1)
+    if workers < 2 or len(named_files) < PARALLEL_MIN_FILES:
+        return [_matching_files(regex, named_files) for regex in regexes]
+
+    chunks = [
+        named_files[i:i + _PARALLEL_CHUNK_FILES]
+        for i in range(0, len(named_files), _PARALLEL_CHUNK_FILES)
+    ]
+    from concurrent.futures import ProcessPoolExecutor
+
+    matched: list[list[str]] = [[] for _ in regexes]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_matcher,
+        initargs=(regexes,),
+    ) as executor:
+        for per_coupling in executor.map(_match_chunk, chunks):
+            for files, chunk_files in zip(matched, per_coupling):
+                files.extend(chunk_files)
+    return matched
+
+
 def check_couplings(
-    changed_files: set[str],
+    changed_files: frozenset[str],
     couplings: list[dict],
     force_strict: bool = False,
 ) -> tuple[list[dict], list[dict]]:
@@ -406,31 +684,24 @@ def check_couplings(
     """
     strict_violations = []
     soft_warnings = []
+    index = _build_coupling_index(couplings)
+    matches = _match_couplings(index, _with_names(changed_files))
 
-    for coupling in couplings:
-        sources = coupling.get("sources", [])
-        docs = coupling.get("docs", [])
-        description = coupling.get("description", "")
+    for coupling, matched_sources in zip(index, matches):
         # When force_strict is True, ignore soft flag
-        is_soft = coupling.get("soft", False) and not force_strict
-
-        # Find which source patterns matched
-        matched_sources = []
-        for changed in changed_files:
-            if matches_any_pattern(changed, sources):
-                matched_sources.append(changed)
+        is_soft = coupling.soft and not force_strict
 
         if not matched_sources:
             continue  # No source files changed for this coupling
 
         # Check if any coupled doc was updated
-        docs_updated = any(doc in changed_files for doc in docs)
+        docs_updated = not changed_files.isdisjoint(coupling.docs)
 
         if not docs_updated:
             violation = {
-                "description": description,
+                "description": coupling.description,
                 "changed_sources": matched_sources,
-                "expected_docs": docs,
+                "expected_docs": list(coupling.docs),
                 "soft": is_soft,
             }
             if is_soft:
@@ -441,24 +712,21 @@ def check_couplings(
     return strict_violations, soft_warnings
 
 
-def print_suggestions(changed_files: set[str], couplings: list[dict]) -> None:
+def print_suggestions(changed_files: frozenset[str], couplings: list[dict]) -> None:
     """Print which docs should be updated based on changed files."""
     print("Based on your changes, consider updating:\n")
 
     suggestions: dict[str, list[str]] = {}  # doc -> [reasons]
+    index = _build_coupling_index(couplings)
+    matches = _match_couplings(index, _with_names(changed_files))
 
-    for coupling in couplings:
-        sources = coupling.get("sources", [])
-        docs = coupling.get("docs", [])
-        description = coupling.get("description", "")
-
-        for changed in changed_files:
-            if matches_any_pattern(changed, sources):
-                for doc in docs:
-                    if doc not in changed_files:
-                        if doc not in suggestions:
-                            suggestions[doc] = []
-                        suggestions[doc].append(f"{changed} ({description})")
+    for coupling, matched in zip(index, matches):
+        for changed in matched:
+            for doc in coupling.docs:
+                if doc not in changed_files:
+                    if doc not in suggestions:
+                        suggestions[doc] = []
+                    suggestions[doc].append(f"{changed} ({coupling.description})")
 
     if not suggestions:
         print("  No documentation updates needed.")
@@ -505,6 +773,11 @@ def main() -> int:
         action="store_true",
         help="Check staged files only (for pre-commit hook)",
     )
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Check the paths listed in FILE ('-' for stdin) instead of asking git",
+    )
     parser.add_argument(
         "--bidirectional",
         action="store_true",
@@ -534,6 +807,11 @@ def main() -> int:
         print(f"Config not found: {config_path}")
         return 1
 
+    # Start listing changed files now so git runs while the config is parsed
+    pending = None
+    if not (args.validate_config or args.suggest_all or args.files_from):
+        pending = _git_diff_names("--cached" if args.staged else f"{args.base}...HEAD")
+
     couplings = load_couplings(config_path)
 
     # Validate config if requested
@@ -555,13 +833,17 @@ def main() -> int:
         return 0
 
     # Get changed files based on mode
-    if args.staged:
-        changed_files = get_staged_files()
+    if args.files_from:
+        changed_files = read_file_list(args.files_from)
+        if not changed_files:
+            return 0
+    elif args.staged:
+        changed_files = get_staged_files(pending)
         if not changed_files:
             # No staged files = nothing to check
             return 0
     else:
-        changed_files = get_changed_files(args.base)
+        changed_files = get_changed_files(args.base, pending)
         if not changed_files:
             print("No changed files detected.")
             return 0
@@ -24,12 +24,16 @@ Usage:
 """
 
 import argparse
+import os
 import re
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import NamedTuple
 
-import yaml
+
+# --all runs with at least this many plans are validated across processes
+PARALLEL_MIN_PLANS = 100
 
 
 class Issue(NamedTuple):
@@ -53,28 +57,40 @@ class ValidationResult(NamedTuple):
         return any(i.level == "warning" for i in self.issues)
 
 
-def load_config(project_root: Path) -> dict:
-    """Load meta-process.yaml configuration."""
-    config_path = project_root / "meta-process.yaml"
-    if not config_path.exists():
+@lru_cache(maxsize=8)
+def _load_yaml(path: Path, mtime_ns: int) -> dict:
+    """Parse a YAML file, cached per (resolved path, mtime) for the process.
+
+    Callers treat the result as read-only. yaml is imported here, so
+    --help and usage errors never load it.
+    """
+    import yaml
+
+    # Prefer the LibYAML C loader; fall back to pure Python when unavailable
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def _load_yaml_if_exists(path: Path) -> dict:
+    """Parse path via _load_yaml, or return {} if it does not exist."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
+    return _load_yaml(path.resolve(), mtime_ns)
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f) or {}
 
+def load_config(project_root: Path) -> dict:
+    """Load meta-process.yaml configuration."""
+    config = _load_yaml_if_exists(project_root / "meta-process.yaml")
     return config.get("planning", {})
 
 
 def load_conceptual_model(project_root: Path, config: dict) -> dict:
     """Load conceptual model if it exists."""
     model_path = config.get("conceptual_model_path", "docs/CONCEPTUAL_MODEL.yaml")
-    full_path = project_root / model_path
-
-    if not full_path.exists():
-        return {}
-
-    with open(full_path) as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_if_exists(project_root / model_path)
 
 
 def get_prohibited_terms(model: dict) -> list[str]:
@@ -85,6 +101,17 @@ def get_prohibited_terms(model: dict) -> list[str]:
     return []
 
 
+@lru_cache(maxsize=None)
+def _prohibited_re(term: str) -> re.Pattern[str]:
+    """Compile one term as a case-insensitive, word-bounded pattern.
+
+    One pattern per term, not an alternation: an alternation stops at the
+    leftmost match, so "event" would hide "event bus". Cached so that
+    --all compiles each term once rather than once per plan.
+    """
+    return re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
+
+
 # Patterns that indicate unverified claims
 UNVERIFIED_PATTERNS = [
     (r"\bI believe\b", "I believe"),
@@ -98,9 +125,183 @@ UNVERIFIED_PATTERNS = [
     (r"\bpossibly\b", "possibly"),
 ]
 
+# All UNVERIFIED_PATTERNS as one alternation: a single search() per line.
+# Pattern i is group i + 1, so match.lastindex names the matched term.
+UNVERIFIED_RE = re.compile(
+    "|".join(f"({pattern})" for pattern, _ in UNVERIFIED_PATTERNS),
+    re.IGNORECASE,
+)
+UNVERIFIED_TERMS = [term for _, term in UNVERIFIED_PATTERNS]
+# Each term's literal text: a line containing none of these cannot match,
+# and the substring test is far cheaper than a case-insensitive search
+UNVERIFIED_NEEDLES = tuple(term.lower() for term in UNVERIFIED_TERMS)
+
+# Sections not checked for unverified claims (like examples or templates)
+SKIP_SECTIONS = ("## Notes", "## References")
+
+
+# Numbered unchecked checkbox, e.g. "1. [ ] Which store owns this?"
+CHECKBOX_RE = re.compile(r"\s*\d+\.\s*\[ \]")
+
+
+def _lines_containing(text: str, needles: tuple[str, ...]) -> set[int]:
+    """Return 1-based numbers of the lines of text containing any needle.
+
+    One str.find sweep per needle over the whole text, so the work is in
+    C and proportional to the hits rather than to the line count.
+    """
+    offsets = set()
+    for needle in needles:
+        pos = text.find(needle)
+        while pos != -1:
+            offsets.add(pos)
+            pos = text.find(needle, pos + 1)
+
+    line_numbers = set()
+    line, last = 1, 0
+    for pos in sorted(offsets):
+        line += text.count("\n", last, pos)
+        last = pos
+        line_numbers.add(line)
+    return line_numbers
+
+
+class PlanScan(NamedTuple):
+    """Line-level findings from one pass over a plan (see scan_plan)."""
+    open_questions: list[tuple[int, str]]  # (line, text) under Before Planning
+    unverified: list[Issue]
+    prohibited: list[Issue]
+
+
+def scan_plan(
+    lines: list[str] | None,
+    questions: bool = True,
+    unverified: bool = True,
+    prohibited_terms: list[str] | None = None,
+    content: str | None = None,
+) -> PlanScan:
+    """Run every line-level check in a single pass over lines.
+
+    Each check keeps its own section state, exactly as if it had walked
+    the file alone; disabled checks cost nothing per line. When no line
+    holds a candidate term and questions are off, no line is visited.
+
+    Args:
+        lines: Plan file lines, or None to split content only if needed.
+        questions: Collect unchecked questions under Open Questions /
+            Before Planning.
+        unverified: Flag unverified claim language.
+        prohibited_terms: Terms to flag; None or empty disables the check.
+        content: The text lines was split from on "\n"; required if
+            lines is None.
+    """
+    open_questions: list[tuple[int, str]] = []
+    unverified_issues: list[Issue] = []
+    prohibited_issues: list[Issue] = []
+
+    prohibited = bool(prohibited_terms)
+
+    # Lines that can match at all, found with a multi-needle sweep of the
+    # whole lowercased text; the regexes then run on those lines only
+    unverified_lines: set[int] = set()
+    prohibited_lines: set[int] = set()
+    if unverified or prohibited:
+        text = ("\n".join(lines) if content is None else content).lower()
+        if unverified:
+            unverified_lines = _lines_containing(text, UNVERIFIED_NEEDLES)
+        if prohibited:
+            prohibited_lines = _lines_containing(
+                text, tuple(term.lower() for term in prohibited_terms)
+            )
+
+    # Clean plans (the common case) stop here
+    if not (questions or unverified_lines or prohibited_lines):
+        return PlanScan([], [], [])
+    if lines is None:
+        lines = content.split("\n")
+
+    # Open Questions: 0 = before the section, 1 = inside it, 2 = past it
+    questions_state = 0 if questions else 2
+    in_before_planning = False
+    in_skip_section = False
+    # Inside a ``` fenced code block: content checks do not apply
+    in_fence = False
+
+    for i, line in enumerate(lines, 1):
+        stripped = line.strip()
+        fence = stripped.startswith("```")
+        if fence:
+            in_fence = not in_fence
+        code = fence or in_fence
+
+        if questions_state < 2:
+            if "## Open Questions" in line:
+                questions_state = 1
+            elif questions_state == 1:
+                if line.startswith("## "):
+                    questions_state = 2
+                elif "### Before Planning" in line:
+                    in_before_planning = True
+                elif "### Resolved" in line:
+                    in_before_planning = False
+                elif (
+                    in_before_planning
+                    # Only a line starting with a digit can be a numbered item
+                    and stripped[:1].isdecimal()
+                    and CHECKBOX_RE.match(line)
+                ):
+                    # Unchecked checkbox with question
+                    open_questions.append((i, stripped))
+
+        if unverified:
+            # Track sections to skip; every marker contains "## ", so one
+            # substring test settles most lines
+            if "## " in line:
+                if any(section in line for section in SKIP_SECTIONS):
+                    in_skip_section = True
+                elif line.startswith("## "):
+                    in_skip_section = False
+
+            # Skip code blocks, and lines that are clearly examples or templates
+            if not (
+                in_skip_section
+                or code
+                or stripped.startswith("`")
+                or ("[" in line and "]" in line and stripped.startswith("-"))
+                or i not in unverified_lines
+            ):
+                # One warning per line, for the first term found
+                match = UNVERIFIED_RE.search(line)
+                if match:
+                    term = UNVERIFIED_TERMS[match.lastindex - 1]
+                    unverified_issues.append(Issue(
+                        "warning",
+                        f"Unverified claim language '{term}' - investigate instead of assuming",
+                        i
+                    ))
 
-def check_open_questions_section(content: str, lines: list[str], level: str) -> list[Issue]:
-    """Check Open Questions section exists and is properly filled."""
+        # Skip code blocks and comments
+        if i in prohibited_lines and not (code or stripped.startswith("#")):
+            lowered = line.lower()
+            for term in prohibited_terms:
+                if term.lower() in lowered and _prohibited_re(term).search(line):
+                    prohibited_issues.append(Issue(
+                        "warning",
+                        f"Prohibited term '{term}' - see conceptual model non_existence section",
+                        i
+                    ))
+
+    return PlanScan(open_questions, unverified_issues, prohibited_issues)
+
+
+def check_open_questions_section(
+    content: str, lines: list[str], level: str, scan: PlanScan | None = None
+) -> list[Issue]:
+    """Check Open Questions section exists and is properly filled.
+
+    Args:
+        scan: Result of scan_plan over lines, if already computed.
+    """
     issues = []
 
     if level == "disabled":
@@ -112,29 +313,9 @@ def check_open_questions_section(content: str, lines: list[str], level: str) ->
         issues.append(Issue(issue_level, "Missing '## Open Questions' section"))
         return issues
 
-    # Find the section
-    in_section = False
-    in_before_planning = False
-    open_questions = []
-
-    for i, line in enumerate(lines, 1):
-        if "## Open Questions" in line:
-            in_section = True
-            continue
-        if in_section and line.startswith("## "):
-            break
-        if in_section and "### Before Planning" in line:
-            in_before_planning = True
-            continue
-        if in_section and "### Resolved" in line:
-            in_before_planning = False
-            continue
-
-        # Look for unresolved questions in Before Planning
-        if in_before_planning:
-            # Match unchecked checkbox with question
-            if re.match(r"\s*\d+\.\s*\[ \]", line):
-                open_questions.append((i, line.strip()))
+    if scan is None:
+        scan = scan_plan(lines, unverified=False)
+    open_questions = scan.open_questions
 
     # If there are unresolved questions and level is required, that's an error
     if open_questions and level == "required":
@@ -165,81 +346,61 @@ def check_uncertainties_section(content: str, lines: list[str], level: str) -> l
     return issues
 
 
-def check_unverified_claims(content: str, lines: list[str], enabled: bool) -> list[Issue]:
-    """Check for unverified claim language."""
-    issues = []
+def check_unverified_claims(
+    content: str, lines: list[str], enabled: bool, scan: PlanScan | None = None
+) -> list[Issue]:
+    """Check for unverified claim language.
 
+    Args:
+        scan: Result of scan_plan over lines, if already computed.
+    """
     if not enabled:
-        return issues
-
-    # Skip checking in certain sections (like examples or templates)
-    skip_sections = ["## Notes", "## References"]
-    in_skip_section = False
-
-    for i, line in enumerate(lines, 1):
-        # Track sections to skip
-        if any(section in line for section in skip_sections):
-            in_skip_section = True
-        elif line.startswith("## "):
-            in_skip_section = False
-
-        if in_skip_section:
-            continue
-
-        # Skip code blocks
-        if line.strip().startswith("```") or line.strip().startswith("`"):
-            continue
-
-        # Skip lines that are clearly examples or templates
-        if "[" in line and "]" in line and line.strip().startswith("-"):
-            continue
-
-        for pattern, term in UNVERIFIED_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                issues.append(Issue(
-                    "warning",
-                    f"Unverified claim language '{term}' - investigate instead of assuming",
-                    i
-                ))
-                break  # One warning per line
-
-    return issues
-
-
-def check_prohibited_terms(content: str, lines: list[str], terms: list[str], enabled: bool) -> list[Issue]:
-    """Check for terms that should not be used."""
-    issues = []
-
+        return []
+    if scan is None:
+        scan = scan_plan(lines, questions=False)
+    return scan.unverified
+
+
+def check_prohibited_terms(
+    content: str,
+    lines: list[str],
+    terms: list[str],
+    enabled: bool,
+    scan: PlanScan | None = None,
+) -> list[Issue]:
+    """Check for terms that should not be used.
+
+    Args:
+        scan: Result of scan_plan over lines with these terms, if already
+            computed.
+    """
     if not enabled or not terms:
-        return issues
-
-    for i, line in enumerate(lines, 1):
-        # Skip code blocks and comments
-        if line.strip().startswith("```") or line.strip().startswith("#"):
-            continue
-
-        for term in terms:
-            # Case-insensitive word boundary match
-            pattern = rf"\b{re.escape(term)}\b"
-            if re.search(pattern, line, re.IGNORECASE):
-                issues.append(Issue(
-                    "warning",
-                    f"Prohibited term '{term}' - see conceptual model non_existence section",
-                    i
-                ))
-
-    return issues
-
-
-def validate_plan(plan_path: Path, config: dict, model: dict, strict: bool = False) -> ValidationResult:
-    """Validate a single plan file."""
+        return []
+    if scan is None:
+        scan = scan_plan(lines, questions=False, unverified=False, prohibited_terms=terms)
+    return scan.prohibited
+
+
+def validate_plan(
+    plan_path: Path,
+    config: dict,
+    model: dict,
+    strict: bool = False,
+    prohibited_terms: list[str] | None = None,
+) -> ValidationResult:
+    """Validate a single plan file.
+
+    Args:
+        prohibited_terms: Pre-extracted get_prohibited_terms(model), so --all
+            reads the conceptual model once. Extracted here if None.
+    """
     issues = []
 
     if not plan_path.exists():
         return ValidationResult(plan_path, [Issue("error", "Plan file does not exist")])
 
-    content = plan_path.read_text()
-    lines = content.split("\n")
+    # One read, one decode; a stray non-UTF-8 byte must not abort an --all run
+    content = plan_path.read_bytes().decode("utf-8", "replace")
 
     # Get configuration levels
     qdp_level = config.get("question_driven_planning", "advisory")
@@ -254,13 +415,26 @@ def validate_plan(plan_path: Path, config: dict, model: dict, strict: bool = Fal
         if ut_level != "disabled":
             ut_level = "required"
 
+    if prohibited_terms is None:
+        prohibited_terms = get_prohibited_terms(model)
+
+    # One pass over the lines feeds every line-level check; open questions
+    # only matter at the required level. scan_plan splits the lines only
+    # if some line can produce an issue.
+    lines: list[str] = []  # the checks below read scan instead
+    scan = scan_plan(
+        None,
+        questions=qdp_level == "required",
+        unverified=warn_unverified,
+        prohibited_terms=prohibited_terms if warn_prohibited else None,
+        content=content,
+    )
+
     # Run checks
-    issues.extend(check_open_questions_section(content, lines, qdp_level))
+    issues.extend(check_open_questions_section(content, lines, qdp_level, scan))
     issues.extend(check_uncertainties_section(content, lines, ut_level))
-    issues.extend(check_unverified_claims(content, lines, warn_unverified))
-
-    prohibited_terms = get_prohibited_terms(model)
-    issues.extend(check_prohibited_terms(content, lines, prohibited_terms, warn_prohibited))
+    issues.extend(check_unverified_claims(content, lines, warn_unverified, scan))
+    issues.extend(check_prohibited_terms(content, lines, prohibited_terms, warn_prohibited, scan))
 
     return ValidationResult(plan_path, issues)
 
@@ -307,11 +481,13 @@ def print_result(result: ValidationResult, verbose: bool = False) -> None:
             print(f"  {result.path.name}: OK")
         return
 
-    print(f"\n{result.path.name}:")
+    # One write per file rather than one per issue
+    out = [f"\n{result.path.name}:"]
     for issue in result.issues:
         prefix = "  ERROR:" if issue.level == "error" else "  WARNING:"
         line_info = f" (line {issue.line})" if issue.line else ""
-        print(f"{prefix}{line_info} {issue.message}")
+        out.append(f"{prefix}{line_info} {issue.message}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -331,6 +507,7 @@ def main():
     project_root = args.project_root
     config = load_config(project_root)
     model = load_conceptual_model(project_root, config)
+    prohibited_terms = get_prohibited_terms(model)
 
     # Collect files to check
     files_to_check = []
@@ -350,12 +527,29 @@ def main():
         print("No plan files found")
         sys.exit(0)
 
-    # Validate
+    # Validate (plans are independent; regex scanning holds the GIL, so
+    # large --all runs fan out to processes). Results keep file order.
+    validate = partial(
+        validate_plan,
+        config=config,
+        model=model,
+        strict=args.strict,
+        prohibited_terms=prohibited_terms,
+    )
+    workers = os.cpu_count() or 1
     results = []
-    for path in files_to_check:
-        result = validate_plan(path, config, model, strict=args.strict)
-        results.append(result)
-        print_result(result, verbose=args.verbose)
+    if args.all and workers >= 2 and len(files_to_check) >= PARALLEL_MIN_PLANS:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(validate, files_to_check, chunksize=8):
+                results.append(result)
+                print_result(result, verbose=args.verbose)
+    else:
+        for path in files_to_check:
+            result = validate(path)
+            results.append(result)
+            print_result(result, verbose=args.verbose)
 
     # Summary
     total_errors = sum(1 for r in results if r.has_errors)
@@ -0,0 +1,96 @@
+"""On-disk layout of the shared claims state in <main>/.claude/.
+
+check_claims.py and safe_worktree_remove.py both read and write these
+files. The names, history bound, mirror format and atomic write live
+here so the two scripts cannot drift apart on which mirror is current.
+
+- active-work.yaml: active claims
+- active-work.state.json: JSON mirror of active-work.yaml, cheaper to parse
+- active-work-completed.yaml: completed history, newest COMPLETED_MAX entries
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CLAIMS_FILE_NAME = "active-work.yaml"
+COMPLETED_FILE_NAME = "active-work-completed.yaml"
+COMPLETED_MAX = 50
+MIRROR_SUFFIX = ".state.json"  # Replaces the claims file's .yaml
+
+
+def write_text_atomic(path: Path, text: str) -> os.stat_result:
+    """Write text via a tempfile + os.replace so readers never see a partial file.
+
+    Returns:
+        The stat of the written file, taken before the replace, so it
+        describes this write even if another writer replaces path next.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; match what a plain open(path, "w") would give
+        umask = os.umask(0)
+        os.umask(umask)
+        os.fchmod(fd, 0o666 & ~umask)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        os.replace(tmp_name, path)
+        return st
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def mirror_stamp(st: os.stat_result) -> list[int]:
+    """Identify one version of a claims file.
+
+    The inode changes on every atomic replace, so two writes in the same
+    mtime tick still differ.
+    """
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+def read_mirror(claims_file: Path) -> dict[str, Any] | None:
+    """Return the mirrored contents of claims_file, or None if not current.
+
+    The mirror records the stamp of the claims file it was written with
+    and is only trusted while the file still has exactly that stamp, so
+    any other write (hand edits, other scripts) wins. Raises OSError if
+    claims_file itself cannot be stat'ed.
+    """
+    stamp = mirror_stamp(claims_file.stat())
+    try:
+        mirror = json.loads(claims_file.with_suffix(MIRROR_SUFFIX).read_bytes())
+        if isinstance(mirror, dict) and mirror.get("source") == stamp:
+            return mirror.get("data") or {}
+    except (OSError, ValueError):
+        pass  # Missing mirror: the caller parses the YAML
+    return None
+
+
+def write_mirror(claims_file: Path, data: dict[str, Any], st: os.stat_result) -> None:
+    """Mirror data just written to claims_file, best effort.
+
+    Only a writer of the claims file may call this; readers never refresh
+    the mirror.
+
+    Args:
+        claims_file: The claims file just written
+        data: What was written to it
+        st: Its stat from write_text_atomic
+    """
+    try:
+        write_text_atomic(
+            claims_file.with_suffix(MIRROR_SUFFIX),
+            json.dumps({"source": mirror_stamp(st), "data": data}, default=str),
+        )
+    except (OSError, TypeError, ValueError):
+        pass  # e.g. read-only checkout: readers fall back to the YAML
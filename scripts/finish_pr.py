@@ -19,16 +19,32 @@ Usage:
 import argparse
 import json
 import os
+import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+# Plan branches look like plan-113-model-access (or just plan-113)
+_PLAN_BRANCH_RE = re.compile(r"^plan-(\d+)(?:-|$)")
 
 
 def run_cmd(
-    cmd: list[str], check: bool = True, capture: bool = True
+    cmd: list[str], check: bool = True, capture: bool = True, discard: bool = False
 ) -> subprocess.CompletedProcess[str]:
-    """Run a command, optionally capturing output."""
+    """Run a command, optionally capturing output.
+
+    discard sends stdout and stderr to /dev/null, for callers that only
+    look at the return code (no pipes to drain).
+    """
+    if discard:
+        return subprocess.run(
+            cmd,
+            check=check,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     return subprocess.run(
         cmd,
         check=check,
@@ -51,6 +67,7 @@ def is_in_worktree() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_main_repo_root() -> Path:
     """Get the main repo root directory."""
     result = run_cmd(["git", "rev-parse", "--git-common-dir"], check=False)
@@ -60,17 +77,31 @@ def get_main_repo_root() -> Path:
     return git_common.parent
 
 
-def check_pr_ci_status(pr_number: int) -> tuple[bool, str]:
-    """Check if PR's CI checks have passed."""
+def _fetch_pr_json(pr_number: int, fields: str) -> tuple[dict[str, Any] | None, str]:
+    """Fetch PR fields with a single `gh pr view --json`.
+
+    Returns:
+        (data, "") on success, (None, stderr) if gh failed.
+    """
     result = run_cmd(
-        ["gh", "pr", "view", str(pr_number), "--json", "statusCheckRollup,mergeable,state"],
+        ["gh", "pr", "view", str(pr_number), "--json", fields],
         check=False,
     )
     if result.returncode != 0:
-        return False, f"Failed to get PR status: {result.stderr}"
+        return None, result.stderr
+    return json.loads(result.stdout), ""
+
+
+def check_pr_ci_status(pr_number: int) -> tuple[bool, str]:
+    """Check if PR's CI checks have passed."""
+    data, error = _fetch_pr_json(pr_number, "statusCheckRollup,mergeable,state")
+    if data is None:
+        return False, f"Failed to get PR status: {error}"
+    return _check_ci(data)
 
-    data = json.loads(result.stdout)
 
+def _check_ci(data: dict[str, Any]) -> tuple[bool, str]:
+    """Check CI status from `gh pr view` JSON with statusCheckRollup,mergeable,state."""
     if data.get("state") == "MERGED":
         return False, "PR is already merged"
 
@@ -122,6 +153,7 @@ def release_claim(branch: str) -> bool:
     result = run_cmd(
         ["python", "scripts/check_claims.py", "--release", "--id", branch],
         check=False,
+        discard=True,
     )
     return result.returncode == 0
 
@@ -129,12 +161,8 @@ def release_claim(branch: str) -> bool:
 
 def extract_plan_number(branch: str) -> str | None:
     """Extract plan number from branch name like 'plan-113-model-access'."""
-    if not branch.startswith("plan-"):
-        return None
-    parts = branch.split("-")
-    if len(parts) >= 2 and parts[1].isdigit():
-        return parts[1]
-    return None
+    match = _PLAN_BRANCH_RE.match(branch)
+    return match.group(1) if match else None
 
 
 def complete_plan(plan_number: str) -> tuple[bool, str]:
@@ -147,21 +175,36 @@ def complete_plan(plan_number: str) -> tuple[bool, str]:
         return False, result.stderr or result.stdout or "Unknown error"
     return True, "Completed"
 
-def find_worktree_path(branch: str) -> Path | None:
-    """Find the worktree path for a branch."""
+@lru_cache(maxsize=1)
+def _worktrees_by_branch() -> dict[str, Path] | None:
+    """Map branch name to worktree path, or None if git failed.
+
+    Parses `git worktree list --porcelain` once per run (records are
+    separated by blank lines); remove_worktree clears the cache.
+    """
     result = run_cmd(["git", "worktree", "list", "--porcelain"], check=False)
     if result.returncode != 0:
         return None
 
-    current_path = None
-    for line in result.stdout.strip().split("\n"):
-        if line.startswith("worktree "):
-            current_path = Path(line[9:])
-        elif line.startswith("branch refs/heads/"):
-            worktree_branch = line[18:]
-            if worktree_branch == branch:
-                return current_path
-    return None
+    by_branch: dict[str, Path] = {}
+    for record in result.stdout.split("\n\n"):
+        path = branch = None
+        for line in record.splitlines():
+            if line.startswith("worktree "):
+                path = line[9:]
+            elif line.startswith("branch refs/heads/"):
+                branch = line[18:]
+        if path is not None and branch is not None:
+            by_branch.setdefault(branch, Path(path))
+    return by_branch
+
+
+def find_worktree_path(branch: str) -> Path | None:
+    """Find the worktree path for a branch."""
+    by_branch = _worktrees_by_branch()
+    if by_branch is None:
+        return None
+    return by_branch.get(branch)
 
 
 def remove_worktree(worktree_path: Path) -> tuple[bool, str]:
@@ -178,11 +221,36 @@ def remove_worktree(worktree_path: Path) -> tuple[bool, str]:
         )
         if result.returncode != 0:
             return False, result.stderr or result.stdout
+    _worktrees_by_branch.cache_clear()
     return True, "Removed"
 
 
 def check_worktree_clean(worktree_path: Path) -> tuple[bool, str]:
-    """Check if worktree has uncommitted changes."""
+    """Check if worktree has uncommitted changes.
+
+    Clean worktrees (the common case) skip a full `git status`: diff-index
+    answers for tracked files and ls-files for untracked ones. status only
+    runs, to describe the changes, when diff-index reports something.
+    """
+    tracked = run_cmd(
+        ["git", "-C", str(worktree_path), "diff-index", "--quiet", "HEAD", "--"],
+        check=False,
+    )
+    if tracked.returncode == 0:
+        untracked = run_cmd(
+            ["git", "-C", str(worktree_path), "ls-files", "--others",
+             "--exclude-standard", "--directory", "--no-empty-directory"],
+            check=False,
+        )
+        if untracked.returncode != 0:
+            return True, ""  # Can't check, assume clean
+        if untracked.stdout.strip():
+            return False, "\n".join(
+                f"?? {name}" for name in untracked.stdout.strip().split("\n")
+            )
+        return True, ""
+
+    # Tracked changes (or stale stat info, or no HEAD): let status decide
     result = run_cmd(
         ["git", "-C", str(worktree_path), "status", "--porcelain"],
         check=False,
@@ -194,17 +262,27 @@ def check_worktree_clean(worktree_path: Path) -> tuple[bool, str]:
     return True, ""
 
 
-def check_worktree_processes(worktree_path: Path) -> list[dict[str, Any]]:
-    """Check for processes using the worktree.
+@lru_cache(maxsize=1)
+def _get_check_procs() -> Callable[[str], list[dict[str, Any]]]:
+    """Resolve safe_worktree_remove's process check once per process.
 
-    Plan #189 Phase 5: Uses safe_worktree_remove's process check.
+    A failed import is remembered too, instead of searching sys.path again
+    on every call.
     """
     try:
         # Import here to avoid circular dependency
         from scripts.safe_worktree_remove import check_processes_using_worktree
-        return check_processes_using_worktree(str(worktree_path))
+        return check_processes_using_worktree
     except ImportError:
-        return []  # Graceful degradation
+        return lambda worktree_path: []  # Graceful degradation
+
+
+def check_worktree_processes(worktree_path: Path) -> list[dict[str, Any]]:
+    """Check for processes using the worktree.
+
+    Plan #189 Phase 5: Uses safe_worktree_remove's process check.
+    """
+    return _get_check_procs()(str(worktree_path))
 
 
 def validate_finish_preconditions(
@@ -237,15 +315,14 @@ def validate_finish_preconditions(
         )
         return False, errors, context
 
-    # 2. Check PR exists and is mergeable
-    result = run_cmd(
-        ["gh", "pr", "view", str(pr_number), "--json", "state,mergeable,headRefName"],
-        check=False,
-    )
-    if result.returncode != 0:
+    # 2. Check PR exists and is mergeable (one gh call, shared with the CI check)
+    fields = "state,mergeable,headRefName"
+    if check_ci:
+        fields += ",statusCheckRollup"
+    data, fetch_error = _fetch_pr_json(pr_number, fields)
+    if data is None:
         errors.append(f"PR #{pr_number} not found or cannot access")
     else:
-        data = json.loads(result.stdout)
         if data.get("state") == "MERGED":
             errors.append(f"PR #{pr_number} is already merged")
         elif data.get("state") == "CLOSED":
@@ -262,7 +339,10 @@ def validate_finish_preconditions(
 
     # 3. Check CI if requested
     if check_ci:
-        ci_ok, ci_msg = check_pr_ci_status(pr_number)
+        if data is None:
+            ci_ok, ci_msg = False, f"Failed to get PR status: {fetch_error}"
+        else:
+            ci_ok, ci_msg = _check_ci(data)
         if not ci_ok:
             errors.append(f"CI check: {ci_msg}")
 
@@ -379,7 +459,7 @@ def finish_pr(branch: str, pr_number: int, check_ci: bool = False) -> bool:
 
     # Step 5: Pull main
     print("📥 Pulling latest main...")
-    run_cmd(["git", "pull", "--rebase", "origin", "main"], check=False)
+    run_cmd(["git", "pull", "--rebase", "origin", "main"], check=False, discard=True)
     print("✅ Main updated")
 
     print()
@@ -13,15 +13,44 @@ Usage:
 """
 
 import argparse
+import json
 import os
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, NamedTuple
 
 import yaml
 
+try:
+    from claims_state import (
+        CLAIMS_FILE_NAME,
+        COMPLETED_FILE_NAME,
+        COMPLETED_MAX,
+        read_mirror,
+        write_mirror,
+        write_text_atomic,
+    )
+except ImportError:  # Imported as scripts.safe_worktree_remove (finish_pr.py)
+    from scripts.claims_state import (
+        CLAIMS_FILE_NAME,
+        COMPLETED_FILE_NAME,
+        COMPLETED_MAX,
+        read_mirror,
+        write_mirror,
+        write_text_atomic,
+    )
+
+# Prefer the LibYAML C bindings; fall back to pure Python when unavailable
+try:
+    from yaml import CSafeDumper as _YDumper, CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeDumper as _YDumper, SafeLoader as _YLoader  # type: ignore[assignment]
+
 # psutil for process checking (Plan #189 Phase 4: Worktree Locking)
 try:
     import psutil
@@ -34,6 +63,25 @@ except ImportError:
 SESSION_MARKER_FILE = ".claude_session"
 SESSION_STALENESS_HOURS = 24  # Block removal if marker is newer than this
 
+# Merged-PR branch names from gh are reused for this long (seconds). A
+# stale list can only miss a just-merged PR, which blocks (the safe side).
+MERGED_PRS_CACHE_FILE = "merged_prs.json"  # under <main>/.claude/
+MERGED_PRS_CACHE_TTL = 300
+
+# The blocked-removal message lists this many processes; the scan stops
+# one past it, which is enough to know there are more
+PROCESSES_SHOWN = 5
+PROCESS_SCAN_LIMIT = PROCESSES_SHOWN + 1
+
+# Parsed YAML files: {path: (mtime_ns, size, data)}, see _load_yaml_cached
+_YAML_CACHE: dict[Path, tuple[int, int, Any]] = {}
+# Claims by resolved worktree path: {path: (mtime_ns, size, index)}, see _claims_index
+_CLAIMS_INDEX: dict[Path, tuple[int, int, dict[str, dict[str, Any]]]] = {}
+
+# Environment for every subprocess: ignore the system git config. Built
+# once at import, so later changes to os.environ are not seen.
+_GIT_ENV = {**os.environ, "GIT_CONFIG_NOSYSTEM": "1"}
+
 
 def run_cmd(cmd: list[str], cwd: str | None = None) -> tuple[bool, str]:
     """Run command and return (success, output)."""
@@ -43,46 +91,102 @@ def run_cmd(cmd: list[str], cwd: str | None = None) -> tuple[bool, str]:
             capture_output=True,
             text=True,
             cwd=cwd,
-            env={**os.environ, "GIT_CONFIG_NOSYSTEM": "1"},
+            env=_GIT_ENV,
         )
         return result.returncode == 0, result.stdout.strip()
     except Exception as e:
         return False, str(e)
 
 
+class WorktreeProbe(NamedTuple):
+    """Branch and status of a worktree, from one git status call."""
+    branch: str  # "" when HEAD is detached
+    changes: str  # porcelain status lines, "" when clean
+
+
+@lru_cache(maxsize=None)
+def _probe_worktree(worktree_path: str) -> WorktreeProbe | str:
+    """Run `git status --porcelain --branch` once for both branch and changes.
+
+    Cached per path; remove_worktree clears the cache when it starts.
+
+    Returns:
+        The probe, or git's output (an error message) if status failed.
+    """
+    success, output = run_cmd(["git", "-C", worktree_path, "status", "--porcelain", "--branch"])
+    if not success:
+        return output
+
+    header, _, changes = output.partition("\n")
+    # "## plan-46...origin/plan-46 [ahead 1]", "## No commits yet on main",
+    # or "## HEAD (no branch)" when detached
+    head = header[3:]
+    for prefix in ("No commits yet on ", "Initial commit on "):
+        if head.startswith(prefix):
+            head = head[len(prefix):]
+    if head.startswith("HEAD (no branch)"):
+        head = ""
+    return WorktreeProbe(head.split("...")[0], changes)
+
+
 def has_uncommitted_changes(worktree_path: str) -> tuple[bool, str]:
     """Check if worktree has uncommitted changes.
 
     Returns (has_changes, details).
     """
     # Check for modified/staged/untracked files
-    success, output = run_cmd(
-        ["git", "status", "--porcelain"],
-        cwd=worktree_path
-    )
+    probe = _probe_worktree(worktree_path)
 
-    if not success:
-        return False, f"Could not check status: {output}"
+    if not isinstance(probe, WorktreeProbe):
+        return False, f"Could not check status: {probe}"
 
-    if output.strip():
-        return True, output
+    if probe.changes.strip():
+        return True, probe.changes
 
     return False, ""
 
 
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the last parse while (mtime_ns, size) match.
+
+    The claims file is read by both check_worktree_claimed and release_claim
+    in one removal. Callers must not mutate the result without first
+    dropping its cache entry. Raises OSError / yaml.YAMLError like a
+    direct read would.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+    data = yaml.load(path.read_bytes(), Loader=_YLoader)
+    _YAML_CACHE[path] = (*key, data)
+    return data
+
+
+def _load_claims(claims_file: Path) -> dict[str, Any]:
+    """Load the claims file, via its JSON mirror when the mirror is current.
+
+    The mirror is shared with check_claims.py; see claims_state.py.
+    """
+    data = read_mirror(claims_file)
+    if data is not None:
+        return data
+    return _load_yaml_cached(claims_file) or {}
+
+
 def get_worktree_branch(worktree_path: str) -> str | None:
     """Get the branch name of a worktree."""
-    success, output = run_cmd(
-        ["git", "branch", "--show-current"],
-        cwd=worktree_path
-    )
-    return output if success else None
+    probe = _probe_worktree(worktree_path)
+    return probe.branch if isinstance(probe, WorktreeProbe) else None
 
 
+@lru_cache(maxsize=1)
 def get_main_repo_root() -> Path:
     """Get the main repo root (not worktree).
 
     For worktrees, returns the main repository's root directory.
+    Cached for the life of the process; see _clear_caches.
     """
     try:
         result = subprocess.run(
@@ -90,7 +194,7 @@ def get_main_repo_root() -> Path:
             capture_output=True,
             text=True,
             check=True,
-            env={**os.environ, "GIT_CONFIG_NOSYSTEM": "1"},
+            env=_GIT_ENV,
         )
         git_dir = Path(result.stdout.strip())
         return git_dir.parent
@@ -98,35 +202,140 @@ def get_main_repo_root() -> Path:
         return Path.cwd()
 
 
-def release_claim(cc_id: str, main_root: Path) -> None:
-    """Release a claim from active-work.yaml.
+def _write_yaml_atomic(path: Path, data: dict[str, Any]) -> os.stat_result:
+    """Dump data to path atomically; returns the stat of this write."""
+    return write_text_atomic(path, yaml.dump(data, Dumper=_YDumper, default_flow_style=False, sort_keys=False))
+
+
+def release_claims(cc_ids: Iterable[str], main_root: Path) -> None:
+    """Release claims from active-work.yaml, with one read and one write.
 
     Plan #206: Auto-release stale claims when worktree cleanup is safe.
+    Released claims are recorded in the completed history.
+
+    Args:
+        cc_ids: cc_id of each claim to release
+        main_root: Main repo root holding .claude/
     """
-    claims_file = main_root / ".claude" / "active-work.yaml"
+    claims_file = main_root / ".claude" / CLAIMS_FILE_NAME
     if not claims_file.exists():
         return
 
     try:
-        data = yaml.safe_load(claims_file.read_text()) or {}
+        data = _load_claims(claims_file)
     except yaml.YAMLError:
         return
 
+    ids = set(cc_ids)
     claims = data.get("claims", [])
-    new_claims = [c for c in claims if c.get("cc_id") != cc_id]
-
-    if len(new_claims) < len(claims):
-        # Found and removed the claim
-        data["claims"] = new_claims
-        # Add to completed list
-        completed = data.get("completed", [])
-        completed.append({
+    new_claims = [c for c in claims if c.get("cc_id") not in ids]
+    if len(new_claims) == len(claims):
+        return
+
+    # Found and removed claims; the cached parse is about to change
+    _YAML_CACHE.pop(claims_file, None)
+    _CLAIMS_INDEX.pop(claims_file, None)
+    data["claims"] = new_claims
+    completed_at = datetime.now(timezone.utc).isoformat()
+    released = [
+        {
             "cc_id": cc_id,
-            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": completed_at,
             "reason": "auto_released_merged_pr",
-        })
-        data["completed"] = completed
-        claims_file.write_text(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        }
+        for cc_id in dict.fromkeys(c.get("cc_id") for c in claims if c.get("cc_id") in ids)
+    ]
+
+    if "completed" in data:
+        # Older files keep history inline; check_claims.py moves it out
+        data["completed"].extend(released)
+    else:
+        completed_file = claims_file.with_name(COMPLETED_FILE_NAME)
+        try:
+            archive = yaml.load(completed_file.read_bytes(), Loader=_YLoader) or {}
+        except FileNotFoundError:
+            archive = {}
+        except (OSError, yaml.YAMLError):
+            archive = None  # Unreadable: leave it alone rather than overwrite
+        if archive is not None:
+            completed = (archive.get("completed") or []) + released
+            _write_yaml_atomic(completed_file, {"completed": completed[-COMPLETED_MAX:]})
+
+    st = _write_yaml_atomic(claims_file, data)
+    write_mirror(claims_file, data, st)
+
+
+def release_claim(cc_id: str, main_root: Path) -> None:
+    """Release one claim from active-work.yaml; see release_claims."""
+    release_claims([cc_id], main_root)
+
+
+def _fetch_merged_head_refs() -> set[str] | None:
+    """Head branch names of recently merged PRs, or None if gh gave nothing."""
+    # Parse straight from the pipe rather than buffering the output as a str
+    with subprocess.Popen(
+        ["gh", "pr", "list", "--state", "merged", "--limit", "100",
+         "--json", "headRefName"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_GIT_ENV,
+    ) as proc:
+        try:
+            prs = json.load(proc.stdout)
+        except ValueError:  # Empty or not JSON
+            prs = None
+    if proc.returncode != 0 or prs is None:
+        return None
+    return {pr["headRefName"] for pr in prs if pr.get("headRefName")}
+
+
+def _cached_merged_refs() -> set[str]:
+    """_fetch_merged_head_refs, shared across runs for MERGED_PRS_CACHE_TTL.
+
+    The list is kept in <main>/.claude/MERGED_PRS_CACHE_FILE, so a batch of
+    cleanups makes one gh call (a process spawn plus a GitHub round trip).
+    """
+    cache_file = get_main_repo_root() / ".claude" / MERGED_PRS_CACHE_FILE
+    try:
+        if time.time() - cache_file.stat().st_mtime < MERGED_PRS_CACHE_TTL:
+            return set(json.loads(cache_file.read_bytes()))
+    except (OSError, ValueError, TypeError):
+        pass  # Missing, expired or unreadable: ask gh
+
+    refs = _fetch_merged_head_refs()
+    if refs is None:
+        return set()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(sorted(refs)))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+    return refs
+
+
+@lru_cache(maxsize=1)
+def _merged_remote_branches() -> frozenset[str]:
+    """Branch names of remote branches merged into origin/main.
+
+    Remote names are stripped ("origin/plan-1-x" -> "plan-1-x"). Raises
+    CalledProcessError if git fails.
+    """
+    result = subprocess.run(
+        ["git", "branch", "-r", "--merged", "origin/main"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_GIT_ENV,
+    )
+    names = set()
+    for line in result.stdout.splitlines():
+        ref = line.strip().split(" -> ")[0]  # "origin/HEAD -> origin/main"
+        _, sep, name = ref.partition("/")
+        if sep and name:
+            names.add(name)
+    return frozenset(names)
 
 
 def is_branch_merged(branch: str) -> bool:
@@ -141,48 +350,25 @@ def is_branch_merged(branch: str) -> bool:
     Note: We don't use git merge-base --is-ancestor because it causes false
     positives for new branches created from main (they're technically ancestors).
     """
-    import json
-
     try:
         # Check 1: Remote branch exists and is in merged list
-        result = subprocess.run(
-            ["git", "branch", "-r", "--merged", "origin/main"],
-            capture_output=True,
-            text=True,
-            check=True,
-            env={**os.environ, "GIT_CONFIG_NOSYSTEM": "1"},
-        )
-        for line in result.stdout.strip().split("\n"):
-            line = line.strip()
-            if line.endswith(f"/{branch}") or line == f"origin/{branch}":
-                return True
+        if branch in _merged_remote_branches():
+            return True
 
         # Check 2: PR for this branch was merged (handles squash-merged PRs)
         # This is the most reliable check for our workflow
-        result = subprocess.run(
-            ["gh", "pr", "list", "--state", "merged", "--limit", "100",
-             "--json", "headRefName"],
-            capture_output=True,
-            text=True,
-            env={**os.environ, "GIT_CONFIG_NOSYSTEM": "1"},
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                prs = json.loads(result.stdout)
-                for pr in prs:
-                    if pr.get("headRefName") == branch:
-                        return True
-            except json.JSONDecodeError:
-                pass
-
-        return False
+        return branch in _cached_merged_refs()
     except subprocess.CalledProcessError:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_current_cc_identity() -> dict[str, Any]:
     """Get the current CC instance's identity.
 
+    Cached for the life of the process (callers must not mutate the
+    returned dict); see _clear_caches.
+
     Returns dict with:
         - branch: Current git branch name
         - is_main: True if on main branch
@@ -199,6 +385,47 @@ def get_current_cc_identity() -> dict[str, Any]:
     }
 
 
+def _clear_caches() -> None:
+    """Forget everything memoized for this process.
+
+    For callers (tests) that change directory or the repo between calls.
+    """
+    get_main_repo_root.cache_clear()
+    get_current_cc_identity.cache_clear()
+    _merged_remote_branches.cache_clear()
+    _resolved.cache_clear()
+    _probe_worktree.cache_clear()
+    _YAML_CACHE.clear()
+    _CLAIMS_INDEX.clear()
+
+
+@lru_cache(maxsize=256)
+def _resolved(path: str) -> str:
+    """str(Path(path).resolve()), remembered per process."""
+    return str(Path(path).resolve())
+
+
+def _claims_index(claims_file: Path) -> dict[str, dict[str, Any]]:
+    """Claims keyed by resolved worktree path, rebuilt when the file changes.
+
+    The first claim for a path wins. Raises OSError / yaml.YAMLError like
+    _load_claims.
+    """
+    st = claims_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CLAIMS_INDEX.get(claims_file)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+
+    index: dict[str, dict[str, Any]] = {}
+    for claim in _load_claims(claims_file).get("claims", []):
+        claim_worktree = claim.get("worktree_path")
+        if claim_worktree:
+            index.setdefault(_resolved(claim_worktree), claim)
+    _CLAIMS_INDEX[claims_file] = (*key, index)
+    return index
+
+
 def check_worktree_claimed(
     worktree_path: str,
     claims_file: Path | None = None,
@@ -213,33 +440,24 @@ def check_worktree_claimed(
         (is_claimed, claim_info) - claim_info is the claim dict if found
     """
     if claims_file is None:
-        claims_file = get_main_repo_root() / ".claude" / "active-work.yaml"
+        claims_file = get_main_repo_root() / ".claude" / CLAIMS_FILE_NAME
 
     if not claims_file.exists():
         return False, None
 
     try:
-        data = yaml.safe_load(claims_file.read_text()) or {}
+        index = _claims_index(claims_file)
     except yaml.YAMLError:
         return False, None
 
-    claims = data.get("claims", [])
-
     # Normalize the worktree path for comparison
-    normalized_path = str(Path(worktree_path).resolve())
-
-    for claim in claims:
-        claim_worktree = claim.get("worktree_path")
-        if claim_worktree:
-            # Normalize claim's worktree path too
-            normalized_claim_path = str(Path(claim_worktree).resolve())
-            if normalized_path == normalized_claim_path:
-                return True, claim
-
-    return False, None
+    claim = index.get(_resolved(worktree_path))
+    return claim is not None, claim
 
 
-def check_processes_using_worktree(worktree_path: str) -> list[dict[str, Any]]:
+def check_processes_using_worktree(
+    worktree_path: str, max_hits: int | None = None
+) -> list[dict[str, Any]]:
     """Check for any processes that have CWD inside the worktree.
 
     Plan #189 Phase 4: Worktree Locking
@@ -248,15 +466,24 @@ def check_processes_using_worktree(worktree_path: str) -> list[dict[str, Any]]:
 
     Args:
         worktree_path: Path to the worktree to check
+        max_hits: Stop scanning once this many processes are found
+            (None scans every process)
 
     Returns:
         List of dicts with pid, name, cwd for each process using the worktree.
-        Empty list if no processes found or psutil not available.
+        Empty list if no processes found, or if psutil is not available
+        off Linux.
     """
+    worktree_abs = os.path.abspath(worktree_path)
+
+    if sys.platform.startswith("linux"):
+        return _processes_using_dir_proc(worktree_abs, max_hits)
+
     if not HAS_PSUTIL:
         return []  # Graceful degradation if psutil not installed
 
-    worktree_abs = os.path.abspath(worktree_path)
+    # Trailing separator so a sibling like <worktree>-old does not match
+    worktree_prefix = worktree_abs.rstrip(os.sep) + os.sep
     processes_using: list[dict[str, Any]] = []
 
     # Iterate over all processes
@@ -265,7 +492,7 @@ def check_processes_using_worktree(worktree_path: str) -> list[dict[str, Any]]:
             info = proc.info
             proc_cwd = info.get('cwd')
 
-            if proc_cwd and proc_cwd.startswith(worktree_abs):
+            if proc_cwd and (proc_cwd == worktree_abs or proc_cwd.startswith(worktree_prefix)):
                 # Skip the current process (we already check that separately)
                 if info['pid'] == os.getpid():
                     continue
@@ -275,6 +502,8 @@ def check_processes_using_worktree(worktree_path: str) -> list[dict[str, Any]]:
                     'name': info['name'],
                     'cwd': proc_cwd,
                 })
+                if max_hits is not None and len(processes_using) >= max_hits:
+                    break
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             # Process disappeared or we can't access it - skip
             continue
@@ -282,6 +511,51 @@ def check_processes_using_worktree(worktree_path: str) -> list[dict[str, Any]]:
     return processes_using
 
 
+def _processes_using_dir_proc(
+    worktree_abs: str, max_hits: int | None = None
+) -> list[dict[str, Any]]:
+    """Linux version of check_processes_using_worktree, reading /proc directly.
+
+    One readlink of /proc/<pid>/cwd per process; the name (comm) is only
+    read for matches. psutil.process_iter costs several syscalls per
+    process on top of that.
+    """
+    my_pid = os.getpid()
+    worktree_prefix = worktree_abs.rstrip(os.sep) + os.sep
+    processes_using: list[dict[str, Any]] = []
+
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                proc_cwd = os.readlink(entry.path + "/cwd")
+            except OSError:
+                # Process disappeared or we can't access it - skip
+                continue
+
+            if proc_cwd == worktree_abs or proc_cwd.startswith(worktree_prefix):
+                pid = int(entry.name)
+                # Skip the current process (we already check that separately)
+                if pid == my_pid:
+                    continue
+
+                try:
+                    with open(entry.path + "/comm") as f:
+                        name = f.read().strip()
+                except OSError:
+                    continue  # Exited since the readlink
+                processes_using.append({
+                    'pid': pid,
+                    'name': name,
+                    'cwd': proc_cwd,
+                })
+                if max_hits is not None and len(processes_using) >= max_hits:
+                    break
+
+    return processes_using
+
+
 def check_session_marker_recent(worktree_path: str) -> tuple[bool, datetime | None]:
     """Check if session marker exists and is recent (< 24h old).
 
@@ -297,9 +571,17 @@ def check_session_marker_recent(worktree_path: str) -> tuple[bool, datetime | No
     """
     marker_path = Path(worktree_path) / SESSION_MARKER_FILE
 
-    if not marker_path.exists():
+    try:
+        mtime = marker_path.stat().st_mtime
+    except OSError:
         return False, None
 
+    # Every refresh rewrites the marker, so a recent mtime settles it
+    # without reading the file. Otherwise the timestamp inside decides
+    # (and is what gets reported).
+    if time.time() - mtime < SESSION_STALENESS_HOURS * 3600:
+        return True, datetime.fromtimestamp(mtime, timezone.utc)
+
     try:
         content = marker_path.read_text().strip()
         # Parse ISO format timestamp
@@ -321,6 +603,38 @@ def check_session_marker_recent(worktree_path: str) -> tuple[bool, datetime | No
         return False, None
 
 
+def _in_background(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """Start fn on a daemon thread; the returned callable joins it.
+
+    The callable returns fn's result or re-raises its exception. A bare
+    thread rather than a ThreadPoolExecutor: importing concurrent.futures
+    costs more than the overlap saves. With a single CPU there is nothing
+    to overlap with, so fn is simply run when the result is asked for.
+    """
+    if (os.cpu_count() or 1) < 2:
+        return fn
+
+    outcome: list[tuple[bool, Any]] = []
+
+    def run() -> None:
+        try:
+            outcome.append((True, fn()))
+        except BaseException as e:
+            outcome.append((False, e))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    def result() -> Any:
+        thread.join()
+        ok, value = outcome[0]
+        if not ok:
+            raise value
+        return value
+
+    return result
+
+
 def should_block_removal(
     worktree_path: str,
     force: bool = False,
@@ -347,14 +661,28 @@ def should_block_removal(
         - reason: "ownership", "claim", "session_marker", "process", or "" if not blocked
         - info: claim dict, session marker info, or process list
     """
-    # Get current CC identity for ownership comparison
-    if my_identity is None:
-        my_identity = get_current_cc_identity()
+    if force:
+        # Nothing can block, so skip the identity, marker and process
+        # checks; the claim is still reported for information
+        _, claim_info = check_worktree_claimed(worktree_path, claims_file)
+        return False, "", claim_info
+
+    # The identity lookup forks git and the process scan walks every
+    # process; run both while the claims file is read, then decide in
+    # the usual order
+    identity_result = _in_background(get_current_cc_identity) if my_identity is None else None
+    processes_result = _in_background(
+        lambda: check_processes_using_worktree(worktree_path, max_hits=PROCESS_SCAN_LIMIT)
+    )
 
     # Check for active claims first
     is_claimed, claim_info = check_worktree_claimed(worktree_path, claims_file)
 
-    if is_claimed and claim_info and not force:
+    # Get current CC identity for ownership comparison
+    if identity_result is not None:
+        my_identity = identity_result()
+
+    if is_claimed and claim_info:
         # Check if the claim owner matches our identity
         claim_owner = claim_info.get("cc_id", "")
 
@@ -384,12 +712,12 @@ def should_block_removal(
 
     # Check for recent session marker
     is_recent, marker_time = check_session_marker_recent(worktree_path)
-    if is_recent and not force:
+    if is_recent:
         return True, "session_marker", {"marker_time": marker_time}
 
     # Plan #189 Phase 4: Check for processes using the worktree
-    processes_using = check_processes_using_worktree(worktree_path)
-    if processes_using and not force:
+    processes_using = processes_result()
+    if processes_using:
         return True, "process", {"processes": processes_using}
 
     # Return claim info if available for informational purposes
@@ -402,6 +730,8 @@ def remove_worktree(worktree_path: str, force: bool = False) -> bool:
     Returns True if removal succeeded, False otherwise.
     """
     path = Path(worktree_path)
+    # Branch and status are probed fresh for each removal
+    _probe_worktree.cache_clear()
 
     if not path.exists():
         print(f"❌ Worktree path does not exist: {worktree_path}")
@@ -412,7 +742,7 @@ def remove_worktree(worktree_path: str, force: bool = False) -> bool:
     try:
         current_dir = os.getcwd()
         worktree_abs = os.path.abspath(worktree_path)
-        if current_dir.startswith(worktree_abs):
+        if current_dir == worktree_abs or current_dir.startswith(worktree_abs.rstrip(os.sep) + os.sep):
             # Get repo root for recovery instructions
             repo_root = Path(__file__).parent.parent.resolve()
             print("❌ BLOCKED: Cannot delete worktree you're currently in!")
@@ -510,11 +840,14 @@ def remove_worktree(worktree_path: str, force: bool = False) -> bool:
     if block and reason == "process" and info:
         processes = info.get("processes", [])
         print(f"❌ BLOCKED: Process(es) are using this worktree!")
-        print(f"   Found {len(processes)} process(es) with CWD in worktree:")
-        for proc in processes[:5]:  # Show first 5
+        if len(processes) > PROCESSES_SHOWN:
+            print(f"   Found more than {PROCESSES_SHOWN} processes with CWD in worktree:")
+        else:
+            print(f"   Found {len(processes)} process(es) with CWD in worktree:")
+        for proc in processes[:PROCESSES_SHOWN]:
             print(f"      PID {proc['pid']}: {proc['name']} ({proc['cwd']})")
-        if len(processes) > 5:
-            print(f"      ... and {len(processes) - 5} more")
+        if len(processes) > PROCESSES_SHOWN:
+            print("      ... and more")
         print()
         print("   Deleting this worktree will break these processes' shells.")
         print("   Wait for them to exit or change directory first.")